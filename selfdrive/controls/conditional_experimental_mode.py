@@ -47,13 +47,12 @@ class ConditionalExperimentalMode:
     self.slower_lead = self.params.get_bool("ConditionalSlowerLead")
     self.stop_lights = self.params.get_bool("ConditionalStopLights")
 
-  def update(self, sm, v_ego, v_lead, v_offset, frogpilot_toggles_updated):
+  def update(self, sm, lead, v_ego, v_lead, v_offset, frogpilot_toggles_updated):
     if frogpilot_toggles_updated:
       self.update_frogpilot_params()
 
-    # Set the current driving states
+    # Set the current driving states, "lead" is this tick's detect_lead() result from the planner
     carstate, modeldata, radarstate = sm['carState'], sm['modelV2'], sm['radarState']
-    lead = self.detect_lead(radarstate)
     lead_distance = radarstate.leadOne.dRel
     speed_difference = radarstate.leadOne.vRel * 3.6
     standstill = carstate.standstill
@@ -120,6 +119,7 @@ class ConditionalExperimentalMode:
 
     return False
 
+  # Stateful, call once per radarState update
   def detect_lead(self, radarstate):
     # Check to make sure the lead isn't crossing the intersection
     if radarstate.leadOne.status and abs(radarstate.leadOne.yRel - self.previous_yRel) < 0.25:
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 import math
 import numpy as np
-from openpilot.common.numpy_fast import clip, interp
 from openpilot.common.params import Params, put_bool_nonblocking
 from cereal import car, log
 
@@ -44,56 +43,118 @@ _A_TOTAL_MAX_BP = [20., 40.]
 TARGET_LAT_A = 1.9  # m/s^2
 MIN_TARGET_V = 5    # m/s
 
+# Breakpoints cached as arrays so the per-tick lookups skip list conversion
+_A_CRUISE_MAX_BP_ARR = np.asarray(A_CRUISE_MAX_BP, dtype=np.float64)
+_A_CRUISE_MAX_VALS_ARR = np.asarray(A_CRUISE_MAX_VALS, dtype=np.float64)
+_A_CRUISE_MIN_BP_CUSTOM_ARR = np.asarray(A_CRUISE_MIN_BP_CUSTOM, dtype=np.float64)
+_A_CRUISE_MAX_BP_CUSTOM_ARR = np.asarray(A_CRUISE_MAX_BP_CUSTOM, dtype=np.float64)
+_A_CRUISE_MIN_VALS_ECO_TUNE_ARR = np.asarray(A_CRUISE_MIN_VALS_ECO_TUNE, dtype=np.float64)
+_A_CRUISE_MAX_VALS_ECO_TUNE_ARR = np.asarray(A_CRUISE_MAX_VALS_ECO_TUNE, dtype=np.float64)
+_A_CRUISE_MIN_VALS_SPORT_TUNE_ARR = np.asarray(A_CRUISE_MIN_VALS_SPORT_TUNE, dtype=np.float64)
+_A_CRUISE_MAX_VALS_SPORT_TUNE_ARR = np.asarray(A_CRUISE_MAX_VALS_SPORT_TUNE, dtype=np.float64)
+_A_TOTAL_MAX_V_ARR = np.asarray(_A_TOTAL_MAX_V, dtype=np.float64)
+_A_TOTAL_MAX_BP_ARR = np.asarray(_A_TOTAL_MAX_BP, dtype=np.float64)
+
+
+def interp_stencil(x, xp):
+  """
+  Precomputes the linear interpolation of fixed points x on the fixed grid xp as a
+  matrix with two nonzeros per row, so W @ fp matches np.interp(x, xp, fp)
+  """
+  xp = np.asarray(xp, dtype=np.float64)
+  x = np.clip(np.asarray(x, dtype=np.float64), xp[0], xp[-1])
+  idx_hi = np.clip(np.searchsorted(xp, x, side='right'), 1, len(xp) - 1)
+  idx_lo = idx_hi - 1
+  w_hi = (x - xp[idx_lo]) / (xp[idx_hi] - xp[idx_lo])
+
+  rows = np.arange(len(x))
+  W = np.zeros((len(x), len(xp)))
+  W[rows, idx_lo] = 1. - w_hi
+  W[rows, idx_hi] = w_hi
+  return W
 
 def get_max_accel(v_ego):
-  return interp(v_ego, A_CRUISE_MAX_BP, A_CRUISE_MAX_VALS)
+  return float(np.interp(v_ego, _A_CRUISE_MAX_BP_ARR, _A_CRUISE_MAX_VALS_ARR))
 
 def get_min_accel_eco_tune(v_ego):
-  return interp(v_ego, A_CRUISE_MIN_BP_CUSTOM, A_CRUISE_MIN_VALS_ECO_TUNE)
+  return float(np.interp(v_ego, _A_CRUISE_MIN_BP_CUSTOM_ARR, _A_CRUISE_MIN_VALS_ECO_TUNE_ARR))
 
 def get_max_accel_eco_tune(v_ego):
-  return interp(v_ego, A_CRUISE_MAX_BP_CUSTOM, A_CRUISE_MAX_VALS_ECO_TUNE)
+  return float(np.interp(v_ego, _A_CRUISE_MAX_BP_CUSTOM_ARR, _A_CRUISE_MAX_VALS_ECO_TUNE_ARR))
 
 def get_min_accel_sport_tune(v_ego):
-  return interp(v_ego, A_CRUISE_MIN_BP_CUSTOM, A_CRUISE_MIN_VALS_SPORT_TUNE)
+  return float(np.interp(v_ego, _A_CRUISE_MIN_BP_CUSTOM_ARR, _A_CRUISE_MIN_VALS_SPORT_TUNE_ARR))
 
 def get_max_accel_sport_tune(v_ego):
-  return interp(v_ego, A_CRUISE_MAX_BP_CUSTOM, A_CRUISE_MAX_VALS_SPORT_TUNE)
+  return float(np.interp(v_ego, _A_CRUISE_MAX_BP_CUSTOM_ARR, _A_CRUISE_MAX_VALS_SPORT_TUNE_ARR))
 
-def limit_accel_in_turns(v_ego, angle_steers, a_target, CP):
+def limit_accel_in_turns(v_ego, angle_steers, a_target, turn_k):
   """
   This function returns a limited long acceleration allowed, depending on the existing lateral acceleration
   this should avoid accelerating when losing the target in turns
+
+  turn_k is CV.DEG_TO_RAD / (steerRatio * wheelbase), precomputed once per vehicle
   """
 
   # FIXME: This function to calculate lateral accel is incorrect and should use the VehicleModel
   # The lookup table for turns should also be updated if we do this
-  a_total_max = interp(v_ego, _A_TOTAL_MAX_BP, _A_TOTAL_MAX_V)
-  a_y = v_ego ** 2 * angle_steers * CV.DEG_TO_RAD / (CP.steerRatio * CP.wheelbase)
-  a_x_allowed = math.sqrt(max(a_total_max ** 2 - a_y ** 2, 0.))
+  a_total_max = float(np.interp(v_ego, _A_TOTAL_MAX_BP_ARR, _A_TOTAL_MAX_V_ARR))
+  a_y = v_ego * v_ego * angle_steers * turn_k
+  a_x_allowed = math.sqrt(max(a_total_max * a_total_max - a_y * a_y, 0.))
 
   return [a_target[0], min(a_target[1], a_x_allowed)]
 
+def get_accel_limits(v_ego, angle_steers, acceleration_profile, turn_k):
+  """
+  This function returns the cruise accel limits for the selected acceleration profile
+  and their turn-limited counterpart
+  """
+  if acceleration_profile == 1:
+    a_min, a_max = get_min_accel_eco_tune(v_ego), get_max_accel_eco_tune(v_ego)
+  elif acceleration_profile == 3:
+    a_min, a_max = get_min_accel_sport_tune(v_ego), get_max_accel_sport_tune(v_ego)
+  else:
+    a_min, a_max = A_CRUISE_MIN, get_max_accel(v_ego)
+
+  accel_limits = [a_min, a_max]
+  return accel_limits, limit_accel_in_turns(v_ego, angle_steers, accel_limits, turn_k)
+
 
 class LongitudinalPlanner:
   def __init__(self, CP, init_v=0.0, init_a=0.0):
     self.CP = CP
     self.mpc = LongitudinalMpc()
+    self._turn_k = CV.DEG_TO_RAD / (CP.steerRatio * CP.wheelbase)
     self.fcw = False
 
     self.a_desired = init_a
     self.v_desired_filter = FirstOrderFilter(init_v, 2.0, DT_MDL)
     self.v_model_error = 0.0
 
-    self.x_desired_trajectory = np.zeros(CONTROL_N)
-    self.v_desired_trajectory = np.zeros(CONTROL_N)
-    self.a_desired_trajectory = np.zeros(CONTROL_N)
-    self.j_desired_trajectory = np.zeros(CONTROL_N)
+    # The MPC and output time grids are fixed, so the interpolation weights are too.
+    # _W_control_T and _W_full_T are stored transposed and applied to LongitudinalMpc.x_sol directly,
+    # so they depend on its columns being [x, v, a] to resample into (state, time) rows
+    self._W_full_T = np.ascontiguousarray(interp_stencil(T_IDXS, T_IDXS_MPC).T)
+    self._W_control_T = np.ascontiguousarray(interp_stencil(T_IDXS[:CONTROL_N], T_IDXS_MPC).T)
+    self._W_j = interp_stencil(T_IDXS[:CONTROL_N], T_IDXS_MPC[:-1])
+    self._W_model = interp_stencil(T_IDXS_MPC, T_IDXS)
+    self._dt_idx = int(np.searchsorted(T_IDXS[:CONTROL_N], DT_MDL, side='right')) - 1
+    self._dt_w = (DT_MDL - T_IDXS[self._dt_idx]) / (T_IDXS[self._dt_idx + 1] - T_IDXS[self._dt_idx])
+
+    # Trajectories are filled in place every tick, one row each for x, v, a and j
+    self._traj = np.zeros((4, CONTROL_N))
+    self._traj_full = np.zeros((2, len(T_IDXS)))
+    self.x_desired_trajectory = self._traj[0]
+    self.v_desired_trajectory = self._traj[1]
+    self.a_desired_trajectory = self._traj[2]
+    self.j_desired_trajectory = self._traj[3]
+    self.v_desired_trajectory_full = self._traj_full[0]
+    self.a_desired_trajectory_full = self._traj_full[1]
+    # Model x, v, a and j resampled onto the MPC grid, reused as the MPC input every tick
+    self._model_traj = np.zeros((4, len(T_IDXS_MPC)))
     self.solverExecutionTime = 0.0
     self.params = Params()
     self.param_read_counter = 0
-    self.read_param()
-    self.personality = log.LongitudinalPersonality.standard
     self.is_metric = self.params.get_bool("IsMetric")
 
     # FrogPilot variables
@@ -101,6 +162,7 @@ class LongitudinalPlanner:
       put_bool_nonblocking("ExperimentalMode", True)
 
     self.green_light = False
+    self._have_lead = False
     self.override_slc = False
     self.previously_driving = False
     self.stopped_for_light_previously = False
@@ -116,54 +178,54 @@ class LongitudinalPlanner:
     except (ValueError, TypeError):
       self.personality = log.LongitudinalPersonality.standard
 
-  @staticmethod
-  def parse_model(model_msg, model_error):
-    if (len(model_msg.position.x) == 33 and
-       len(model_msg.velocity.x) == 33 and
-       len(model_msg.acceleration.x) == 33):
-      x = np.interp(T_IDXS_MPC, T_IDXS, model_msg.position.x) - model_error * T_IDXS_MPC
-      v = np.interp(T_IDXS_MPC, T_IDXS, model_msg.velocity.x) - model_error
-      a = np.interp(T_IDXS_MPC, T_IDXS, model_msg.acceleration.x)
-      j = np.zeros(len(T_IDXS_MPC))
+  def parse_model(self, model_msg, model_error):
+    x, v, a, j = self._model_traj
+    # Every capnp field access builds a new reader, so fetch each list once
+    position, velocity, acceleration = model_msg.position.x, model_msg.velocity.x, model_msg.acceleration.x
+    n = len(position)
+    if n == 33 and len(velocity) == n and len(acceleration) == n:
+      np.dot(self._W_model, position, out=x)
+      x -= model_error * T_IDXS_MPC
+      np.dot(self._W_model, velocity, out=v)
+      v -= model_error
+      np.dot(self._W_model, acceleration, out=a)
+      j.fill(0.)
     else:
-      x = np.zeros(len(T_IDXS_MPC))
-      v = np.zeros(len(T_IDXS_MPC))
-      a = np.zeros(len(T_IDXS_MPC))
-      j = np.zeros(len(T_IDXS_MPC))
+      self._model_traj.fill(0.)
     return x, v, a, j
 
   def update(self, sm, frogpilot_toggles_updated):
     # Update FrogPilot variables when they are changed
     if frogpilot_toggles_updated:
       self.update_frogpilot_params()
-
-    if self.param_read_counter % 50 == 0:
+    elif self.param_read_counter % 50 == 0:
       self.read_param()
     self.param_read_counter += 1
-    self.mpc.mode = 'blended' if sm['controlsState'].experimentalMode else 'acc'
 
-    v_ego = sm['carState'].vEgo
-    v_lead = sm['radarState'].leadOne.vLead
-    v_cruise_kph = min(sm['controlsState'].vCruise, V_CRUISE_MAX)
+    carstate, controlsstate, modeldata, radarstate = sm['carState'], sm['controlsState'], sm['modelV2'], sm['radarState']
+    standstill = carstate.standstill
+
+    self.mpc.mode = 'blended' if controlsstate.experimentalMode else 'acc'
+
+    v_ego = carstate.vEgo
+    v_lead = radarstate.leadOne.vLead
+    v_cruise_kph = min(controlsstate.vCruise, V_CRUISE_MAX)
     v_cruise = v_cruise_kph * CV.KPH_TO_MS
 
-    long_control_off = sm['controlsState'].longControlState == LongCtrlState.off
-    force_slow_decel = sm['controlsState'].forceDecel
+    # detect_lead() filters the lead status over time, so it must only run once per tick
+    self._have_lead = ConditionalExperimentalMode.detect_lead(radarstate)
+
+    long_control_off = controlsstate.longControlState == LongCtrlState.off
+    force_slow_decel = controlsstate.forceDecel
 
     # Reset current state when not engaged, or user is controlling the speed
-    reset_state = long_control_off if self.CP.openpilotLongitudinalControl else not sm['controlsState'].enabled
+    reset_state = long_control_off if self.CP.openpilotLongitudinalControl else not controlsstate.enabled
 
     # No change cost when user is controlling the speed, or when standstill
-    prev_accel_constraint = not (reset_state or sm['carState'].standstill)
+    prev_accel_constraint = not (reset_state or standstill)
 
     if self.mpc.mode == 'acc':
-      if self.acceleration_profile == 1:
-        accel_limits = [get_min_accel_eco_tune(v_ego), get_max_accel_eco_tune(v_ego)]
-      elif self.acceleration_profile == 2:
-        accel_limits = [A_CRUISE_MIN, get_max_accel(v_ego)]
-      elif self.acceleration_profile == 3:
-        accel_limits = [get_min_accel_sport_tune(v_ego), get_max_accel_sport_tune(v_ego)]
-      accel_limits_turns = limit_accel_in_turns(v_ego, sm['carState'].steeringAngleDeg, accel_limits, self.CP)
+      accel_limits, accel_limits_turns = get_accel_limits(v_ego, carstate.steeringAngleDeg, self.acceleration_profile, self._turn_k)
     else:
       accel_limits = [ACCEL_MIN, ACCEL_MAX]
       accel_limits_turns = [ACCEL_MIN, ACCEL_MAX]
@@ -171,12 +233,12 @@ class LongitudinalPlanner:
     if reset_state:
       self.v_desired_filter.x = v_ego
       # Clip aEgo to cruise limits to prevent large accelerations when becoming active
-      self.a_desired = clip(sm['carState'].aEgo, accel_limits[0], accel_limits[1])
+      self.a_desired = max(accel_limits[0], min(accel_limits[1], carstate.aEgo))
 
     # Prevent divergence, smooth in current v_ego
     self.v_desired_filter.x = max(0.0, self.v_desired_filter.update(v_ego))
     # Compute model v_ego error
-    self.v_model_error = get_speed_error(sm['modelV2'], v_ego)
+    self.v_model_error = get_speed_error(modeldata, v_ego)
 
     if force_slow_decel:
       v_cruise = 0.0
@@ -184,15 +246,11 @@ class LongitudinalPlanner:
     accel_limits_turns[0] = min(accel_limits_turns[0], self.a_desired + 0.05)
     accel_limits_turns[1] = max(accel_limits_turns[1], self.a_desired - 0.05)
 
-    carstate, modeldata, radarstate = sm['carState'], sm['modelV2'], sm['radarState']
-
     # Pfeiferj's Speed Limit Controller
     if self.speed_limit_controller:
       desired_speed_limit = slc.desired_speed_limit
 
-      self.override_slc |= carstate.gasPressed
-      self.override_slc &= not carstate.brakePressed
-      self.override_slc &= v_ego > desired_speed_limit
+      self.override_slc = (self.override_slc or carstate.gasPressed) and not carstate.brakePressed and v_ego > desired_speed_limit
 
       slc.update_current_max_velocity(carstate.cruiseState.speedLimit, v_cruise, frogpilot_toggles_updated)
       if 0 < desired_speed_limit < v_cruise and not self.override_slc:
@@ -200,67 +258,68 @@ class LongitudinalPlanner:
 
     # Pfeiferj's Vision Turn Controller
     if self.vision_turn_controller and prev_accel_constraint and v_ego > 1:
-      # Set the curve sensitivity
-      orientation_rate = np.array(np.abs(modeldata.orientationRate.z)) * self.curve_sensitivity
-      velocity = np.array(modeldata.velocity.x)
+      # Get the predicted lat accel from the model in place to avoid temporaries
+      pred_lat_acc = np.abs(modeldata.orientationRate.z)
+      np.multiply(pred_lat_acc, modeldata.velocity.x, out=pred_lat_acc)
 
-      # Get the maximum lat accel from the model
-      self.max_pred_lat_acc = np.amax(orientation_rate * velocity)
-
-      # Get the maximum curve based on the current velocity
-      max_curve = self.max_pred_lat_acc / (v_ego**2)
+      # Get the maximum lat accel from the model with the curve sensitivity applied
+      self.max_pred_lat_acc = float(np.amax(pred_lat_acc)) * self.curve_sensitivity
 
       # Set the target lateral acceleration
       adjusted_target_lat_a = TARGET_LAT_A * self.turn_aggressiveness
 
-      # Get the target velocity for the maximum curve
-      self.v_target = (adjusted_target_lat_a / max_curve) ** 0.5
-      self.v_target = np.nanmax([self.v_target, MIN_TARGET_V])
+      # The target velocity only binds below v_cruise, so test that without the division and sqrt
+      if adjusted_target_lat_a * v_ego * v_ego >= v_cruise * v_cruise * self.max_pred_lat_acc:
+        self.v_target = v_cruise
+        self.v_offset = 0
+      else:
+        # Get the maximum curve based on the current velocity
+        max_curve = self.max_pred_lat_acc / (v_ego * v_ego)
+
+        # Get the target velocity for the maximum curve, a NaN from the model falls back to MIN_TARGET_V
+        v_target = math.sqrt(adjusted_target_lat_a / max_curve)
+        self.v_target = MIN_TARGET_V if (v_target != v_target or v_target < MIN_TARGET_V) else v_target
 
-      # Configure the offset value for the UI
-      self.v_offset = max(0, int(v_cruise - self.v_target))
+        # Configure the offset value for the UI
+        self.v_offset = max(0, int(v_cruise - self.v_target))
 
-      # Set v_cruise to the desired speed
-      v_cruise = min(v_cruise, self.v_target)
+        # Set v_cruise to the desired speed
+        v_cruise = min(v_cruise, self.v_target)
     else:
       self.v_offset = 0
 
     self.mpc.set_weights(prev_accel_constraint, self.custom_personalities, self.aggressive_jerk, self.standard_jerk, self.relaxed_jerk, personality=self.personality)
     self.mpc.set_accel_limits(accel_limits_turns[0], accel_limits_turns[1])
     self.mpc.set_cur_state(self.v_desired_filter.x, self.a_desired)
-    x, v, a, j = self.parse_model(sm['modelV2'], self.v_model_error)
-    self.mpc.update(sm['radarState'], v_cruise, x, v, a, j, self.aggressive_acceleration, self.increased_stopping_distance, self.smoother_braking,
+    x, v, a, j = self.parse_model(modeldata, self.v_model_error)
+    self.mpc.update(radarstate, v_cruise, x, v, a, j, self.aggressive_acceleration, self.increased_stopping_distance, self.smoother_braking,
                     self.custom_personalities, self.aggressive_follow, self.standard_follow, self.relaxed_follow, personality=self.personality)
 
-    self.x_desired_trajectory_full = np.interp(T_IDXS, T_IDXS_MPC, self.mpc.x_solution)
-    self.v_desired_trajectory_full = np.interp(T_IDXS, T_IDXS_MPC, self.mpc.v_solution)
-    self.a_desired_trajectory_full = np.interp(T_IDXS, T_IDXS_MPC, self.mpc.a_solution)
-    self.x_desired_trajectory = self.x_desired_trajectory_full[:CONTROL_N]
-    self.v_desired_trajectory = self.v_desired_trajectory_full[:CONTROL_N]
-    self.a_desired_trajectory = self.a_desired_trajectory_full[:CONTROL_N]
-    self.j_desired_trajectory = np.interp(T_IDXS[:CONTROL_N], T_IDXS_MPC[:-1], self.mpc.j_solution)
+    # mpc.x_sol holds the x, v and a solutions as columns, resample them all at once.
+    # Full length speed and accel trajectories are also used for the uiPlan
+    np.dot(self.mpc.x_sol.T, self._W_control_T, out=self._traj[:3])
+    np.dot(self.mpc.x_sol[:, 1:].T, self._W_full_T, out=self._traj_full)
+    np.dot(self._W_j, self.mpc.j_solution, out=self.j_desired_trajectory)
 
     # TODO counter is only needed because radar is glitchy, remove once radar is gone
-    self.fcw = self.mpc.crash_cnt > 2 and not sm['carState'].standstill
+    self.fcw = self.mpc.crash_cnt > 2 and not standstill
     if self.fcw:
       cloudlog.info("FCW triggered")
 
     # Interpolate 0.05 seconds and save as starting point for next iteration
     a_prev = self.a_desired
-    self.a_desired = float(interp(DT_MDL, T_IDXS[:CONTROL_N], self.a_desired_trajectory))
+    self.a_desired = float((1. - self._dt_w) * self.a_desired_trajectory[self._dt_idx] + self._dt_w * self.a_desired_trajectory[self._dt_idx + 1])
     self.v_desired_filter.x = self.v_desired_filter.x + DT_MDL * (self.a_desired + a_prev) / 2.0
 
     # Conditional Experimental Mode
-    if self.conditional_experimental_mode and sm['controlsState'].enabled:
-      ConditionalExperimentalMode.update(sm, v_ego, v_lead, self.v_offset, frogpilot_toggles_updated)
+    if self.conditional_experimental_mode and controlsstate.enabled:
+      ConditionalExperimentalMode.update(sm, self._have_lead, v_ego, v_lead, self.v_offset, frogpilot_toggles_updated)
 
     # Green light alert
     if self.green_light_alert:
-      lead = ConditionalExperimentalMode.detect_lead(radarstate)
-      standstill = carstate.standstill
+      lead = self._have_lead
 
-      self.previously_driving |= not standstill
-      self.previously_driving &= sm['carControl'].drivingGear
+      self.previously_driving = (self.previously_driving or not standstill) and sm['carControl'].drivingGear
 
       stopped_for_light = ConditionalExperimentalMode.stop_sign_and_light(carstate, lead, radarstate.leadOne.dRel, modeldata, v_ego, v_lead) and standstill and self.previously_driving
       self.green_light = not stopped_for_light and self.stopped_for_light_previously and not lead
@@ -275,10 +334,12 @@ class LongitudinalPlanner:
     longitudinalPlan.modelMonoTime = sm.logMonoTime['modelV2']
     longitudinalPlan.processingDelay = (plan_send.logMonoTime / 1e9) - sm.logMonoTime['modelV2']
 
-    longitudinalPlan.distances = self.x_desired_trajectory.tolist()
-    longitudinalPlan.speeds = self.v_desired_trajectory.tolist()
-    longitudinalPlan.accels = self.a_desired_trajectory.tolist()
-    longitudinalPlan.jerks = self.j_desired_trajectory.tolist()
+    # pycapnp list setters only accept list/tuple, so convert the whole trajectory block in a single tolist()
+    distances, speeds, accels, jerks = self._traj.tolist()
+    longitudinalPlan.distances = distances
+    longitudinalPlan.speeds = speeds
+    longitudinalPlan.accels = accels
+    longitudinalPlan.jerks = jerks
 
     longitudinalPlan.hasLead = sm['radarState'].leadOne.status
     longitudinalPlan.longitudinalPlanSource = self.mpc.source
@@ -295,7 +356,7 @@ class LongitudinalPlanner:
     longitudinalPlan.slcSpeedLimitOffset = slc.offset
     longitudinalPlan.vtscOffset = self.v_offset
     # LongitudinalPlan variables for onroad driving insights
-    have_lead = ConditionalExperimentalMode.detect_lead(sm['radarState'])
+    have_lead = self._have_lead
     longitudinalPlan.safeObstacleDistance = self.mpc.safe_obstacle_distance if have_lead else 0
     longitudinalPlan.stoppedEquivalenceFactor = self.mpc.stopped_equivalence_factor if have_lead else 0
     longitudinalPlan.desiredFollowDistance = self.mpc.safe_obstacle_distance - self.mpc.stopped_equivalence_factor if have_lead else 0
@@ -328,3 +389,6 @@ class LongitudinalPlanner:
     if self.vision_turn_controller:
       self.curve_sensitivity = self.params.get_int("CurveSensitivity") / 100
       self.turn_aggressiveness = self.params.get_int("TurnAggressiveness") / 100
+
+    # Refresh the personality in the same pass so the periodic poll can be skipped
+    self.read_param()